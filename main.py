@@ -4,10 +4,219 @@
 import argparse
 import sys
 import os
+import importlib
+import tempfile
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 
 # Define the character set and base
 CHARSET = 'ABCDEFGHJKLMNPQRSTUVWXYZ23456789'
 BASE = len(CHARSET)  # 32
+DIGIT_BITS = BASE.bit_length() - 1  # 5 bits per NewCode digit
+
+# Digit characters used by int() and gmpy2 for base 32
+INT_DIGITS = '0123456789abcdefghijklmnopqrstuv'
+
+# Byte value -> int() digit lookup for decoding, accepting either case;
+# bytes outside CHARSET map to INVALID_DIGIT
+INVALID_DIGIT = 0xFF
+DECODE_TABLE = bytearray([INVALID_DIGIT]) * 256
+for _index, _char in enumerate(CHARSET):
+    DECODE_TABLE[ord(_char)] = DECODE_TABLE[ord(_char.lower())] = ord(INT_DIGITS[_index])
+DECODE_TABLE = bytes(DECODE_TABLE)
+del _index, _char
+
+# Translation tables for encoding, from int()/gmpy2 digits and from raw digit values
+ENCODE_TABLE = bytes.maketrans(INT_DIGITS.encode('ascii'), CHARSET.encode('ascii'))
+VALUE_TABLE = bytes.maketrans(bytes(range(BASE)), CHARSET.encode('ascii'))
+
+# Numbers with at most this many digits are converted with a plain shift loop
+DIGIT_CUTOFF = 128
+
+# Two-digit strings indexed by a 10-bit value, so digits are emitted in pairs
+PAIR_BITS = 2 * DIGIT_BITS
+PAIR_MASK = (1 << PAIR_BITS) - 1
+PAIRS = tuple(a + b for a in CHARSET for b in CHARSET)
+REVERSED_PAIRS = tuple(b + a for a in CHARSET for b in CHARSET)
+
+# A group is 4 digits (20 bits), written in reverse
+GROUP_BITS = 4 * DIGIT_BITS
+GROUP_MASK = (1 << GROUP_BITS) - 1
+
+# Digits peeled off the number per big-int shift (60 bits, a single machine word)
+CHUNK_DIGITS = 12
+CHUNK_PAIRS = CHUNK_DIGITS // 2
+CHUNK_BITS = CHUNK_DIGITS * DIGIT_BITS
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+# Files are encoded in fixed-size blocks so they can be streamed. The last block
+# is padded with FILE_PAD_MARKER followed by null bytes, so the length survives.
+FILE_BLOCK_BYTES = 80  # 640 bits
+FILE_BLOCK_DIGITS = FILE_BLOCK_BYTES * 8 // DIGIT_BITS  # 128
+FILE_BLOCK_CHARS = FILE_BLOCK_DIGITS // 4 * 5 - 1  # 32 groups and their separators
+FILE_PAD_MARKER = b'\x80'
+FILE_READ_BYTES = FILE_BLOCK_BYTES * 1024
+
+# Files of at least this many blocks (5 MB) are encoded and decoded on a process pool
+FILE_PARALLEL_BLOCKS = 64 * 1024
+FILE_BATCH_BLOCKS = 16 * 1024  # blocks submitted to the pool at a time
+FILE_CHUNK_BLOCKS = 256  # blocks sent to a worker per task
+
+def _emit_digits(num, ndigits, out):
+    """
+    Append exactly ndigits NewCode characters for num to out, most significant first.
+    
+    Large numbers are split in halves and converted recursively, so the total
+    cost is O(n log n) instead of the O(n^2) of shifting one digit at a time.
+    
+    Args:
+        num (int): The non-negative integer to convert.
+        ndigits (int): Number of digits to emit (zero-padded with 'A's).
+        out (list): The list receiving string pieces of the result.
+    """
+    if ndigits <= DIGIT_CUTOFF:
+        npairs = (ndigits + 1) // 2
+        pairs = [PAIRS[0]] * npairs
+        pos = npairs
+        while num:
+            # One big-int shift per chunk; the digits come from a small int
+            chunk = num & CHUNK_MASK
+            num >>= CHUNK_BITS
+            i = pos
+            while chunk:
+                i -= 1
+                pairs[i] = PAIRS[chunk & PAIR_MASK]
+                chunk >>= PAIR_BITS
+            pos -= CHUNK_PAIRS
+        # An odd digit count leaves one leading 'A' of padding in the first pair
+        out.append(''.join(pairs)[ndigits & 1:])
+        return
+    
+    lo_digits = ndigits // 2
+    lo_bits = lo_digits * DIGIT_BITS
+    hi = num >> lo_bits
+    _emit_digits(hi, ndigits - lo_digits, out)
+    _emit_digits(num - (hi << lo_bits), lo_digits, out)
+
+@lru_cache(maxsize=None)
+def _optional_module(name):
+    """
+    Import an optional accelerator (gmpy2 or numpy) on first use.
+    
+    They only pay off for large numbers, so they are kept out of the startup
+    path of the CLI.
+    
+    Args:
+        name (str): The module name.
+    
+    Returns:
+        module: The module, or None if it is not installed.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+def _numpy_digits(np, num, ndigits):
+    """
+    Return exactly ndigits NewCode characters for num using NumPy bit unpacking.
+    
+    Args:
+        np (module): The NumPy module.
+        num (int): The non-negative integer to convert.
+        ndigits (int): Number of digits to return (zero-padded with 'A's).
+    
+    Returns:
+        str: The NewCode digits, most significant first.
+    """
+    nbits = ndigits * DIGIT_BITS
+    nbytes = (nbits + 7) // 8
+    bits = np.unpackbits(np.frombuffer(num.to_bytes(nbytes, 'big'), dtype=np.uint8))
+    # Drop the leading pad bits, then pack each 5-bit row into the top of a byte
+    digits = np.packbits(bits[nbytes * 8 - nbits:].reshape(-1, DIGIT_BITS), axis=1).ravel()
+    digits >>= 8 - DIGIT_BITS
+    return digits.tobytes().translate(VALUE_TABLE).decode('ascii')
+
+def _int_to_digit_str(num, ndigits=None, use_gmpy2=None):
+    """
+    Convert an integer to its ungrouped NewCode digits, most significant first.
+    
+    Large numbers use gmpy2 when available, then NumPy, then pure Python;
+    small numbers use pure Python unless use_gmpy2 is set.
+    
+    Args:
+        num (int): The non-negative integer to convert.
+        ndigits (int, optional): Fixed number of digits (zero-padded with 'A's).
+            Defaults to the minimal number of digits.
+        use_gmpy2 (bool, optional): Whether to try gmpy2. Defaults to True for
+            large numbers only, keeping its import off the path of short inputs.
+    
+    Returns:
+        str: The NewCode digits.
+    """
+    if ndigits is None:
+        ndigits = (num.bit_length() + DIGIT_BITS - 1) // DIGIT_BITS
+    
+    if use_gmpy2 is None:
+        use_gmpy2 = ndigits > DIGIT_CUTOFF
+    if use_gmpy2:
+        gmpy2 = _optional_module('gmpy2')
+        if gmpy2 is not None:
+            digits = gmpy2.digits(num, BASE).rjust(ndigits, '0')
+            return digits.encode('ascii').translate(ENCODE_TABLE).decode('ascii')
+    
+    if ndigits > DIGIT_CUTOFF:
+        np = _optional_module('numpy')
+        if np is not None:
+            return _numpy_digits(np, num, ndigits)
+    
+    pieces = []
+    _emit_digits(num, ndigits, pieces)
+    return ''.join(pieces)
+
+def _group_digits(chars):
+    """
+    Group NewCode digits into reversed 4-character segments joined by '-'.
+    
+    Args:
+        chars (str): The NewCode digits, most significant first.
+    
+    Returns:
+        str: The grouped NewCode string.
+    """
+    # Pad with 'A's to a whole number of 4-character groups
+    data = (chars + CHARSET[0] * (-len(chars) % 4)).encode('ascii')
+    
+    # Group from most significant first, reversing each group for better readability:
+    # character j of every group is written to every fifth byte in one slice assignment
+    buf = bytearray(b'-') * (len(data) // 4 * 5 - 1)
+    for j in range(4):
+        buf[j::5] = data[3 - j::4]
+    return buf.decode('ascii')
+
+def _small_int_to_crypttext(num):
+    """
+    Convert a positive integer of at most CHUNK_BITS bits to a NewCode string.
+    
+    Short inputs such as words are common, so they skip the general path and
+    build each reversed group straight from two REVERSED_PAIRS lookups.
+    
+    Args:
+        num (int): The positive integer to convert.
+    
+    Returns:
+        str: The NewCode string.
+    """
+    ndigits = (num.bit_length() + DIGIT_BITS - 1) // DIGIT_BITS
+    ngroups = (ndigits + 3) // 4
+    # Pad with 'A's (zero digits) to a whole number of groups
+    num <<= (ngroups * 4 - ndigits) * DIGIT_BITS
+    groups = []
+    for shift in range((ngroups - 1) * GROUP_BITS, -1, -GROUP_BITS):
+        group = (num >> shift) & GROUP_MASK
+        groups.append(REVERSED_PAIRS[group & PAIR_MASK] + REVERSED_PAIRS[group >> PAIR_BITS])
+    return '-'.join(groups)
 
 def int_to_crypttext(num):
     """
@@ -21,28 +230,51 @@ def int_to_crypttext(num):
     """
     if num == 0:
         return CHARSET[0]
+    if num.bit_length() <= CHUNK_BITS:
+        return _small_int_to_crypttext(num)
     
-    chars = []
-    while num > 0:
-        rem = num % BASE
-        chars.append(CHARSET[rem])
-        num = num // BASE
+    return _group_digits(_int_to_digit_str(num))
+
+def _ungroup_digits(crypttext):
+    """
+    Undo the grouping of a NewCode string and map it to int() digits.
     
-    # Reverse to make most significant digits first
-    chars = chars[::-1]
+    Args:
+        crypttext (str): The NewCode string.
+    
+    Returns:
+        bytes: The int() digits, most significant first; invalid characters
+            become INVALID_DIGIT.
+    """
+    # Non-ASCII characters become '?', which keeps positions aligned for error reporting
+    data = crypttext.encode('ascii', 'replace')
     
-    # Group into 4-character segments from most significant first, pad with 'A's
-    grouped = []
-    for i in range(0, len(chars), 4):
-        group = ''.join(chars[i:i+4])
-        if len(group) < 4:
-            group = group.ljust(4, 'A')  # Pad with 'A's to make 4 characters
-        grouped.append(group)
+    # Reverse each group back to original order and map to int() digits, folding case
+    return b''.join([group[::-1] for group in data.split(b'-')]).translate(DECODE_TABLE)
+
+def _parse_digits(digits, crypttext):
+    """
+    Parse int() digits produced by _ungroup_digits.
+    
+    Args:
+        digits (bytes): The digits to parse.
+        crypttext (str): The NewCode string they came from, for error reporting.
     
-    # Reverse each group for better readability
-    grouped = [group[::-1] for group in grouped]
+    Returns:
+        int: The corresponding integer.
     
-    return '-'.join(grouped)
+    Raises:
+        ValueError: If the crypttext contains invalid characters.
+    """
+    # int() parses power-of-two bases in linear time in C. DECODE_TABLE only
+    # produces base-32 digits or INVALID_DIGIT, so int() rejecting the input
+    # means an invalid character, which is only located on this error path.
+    try:
+        return int(digits, BASE)
+    except ValueError:
+        digit_str = ''.join([group[::-1] for group in crypttext.split('-')])
+        char = digit_str[digits.index(INVALID_DIGIT)].upper()
+        raise ValueError(f"Invalid character: {char}") from None
 
 def crypttext_to_int(crypttext):
     """
@@ -57,26 +289,11 @@ def crypttext_to_int(crypttext):
     Raises:
         ValueError: If the crypttext contains invalid characters.
     """
-    groups = crypttext.upper().split('-')
-    reversed_chars = []
-    for group in groups:
-        # Reverse each group back to original order
-        reversed_group = group[::-1]
-        reversed_chars.extend(reversed_group)
-    
-    # Convert list to string
-    digit_str = ''.join(reversed_chars)
-    
-    # Remove trailing 'A's used for padding
-    digit_str = digit_str.rstrip('A')
-    
-    num = 0
-    for char in digit_str:
-        if char not in CHARSET:
-            raise ValueError(f"Invalid character: {char}")
-        index = CHARSET.index(char)
-        num = num * BASE + index
-    return num
+    # Remove the trailing 'A's (now '0's) used for padding
+    digits = _ungroup_digits(crypttext).rstrip(b'0')
+    if not digits:
+        return 0
+    return _parse_digits(digits, crypttext)
 
 def text_to_int(text):
     """
@@ -88,11 +305,7 @@ def text_to_int(text):
     Returns:
         int: The corresponding integer.
     """
-    utf8_bytes = text.encode('utf-8')
-    num = 0
-    for byte in utf8_bytes:
-        num = (num << 8) + byte
-    return num
+    return int.from_bytes(text.encode('utf-8'), 'big')
 
 def int_to_text(num):
     """
@@ -109,63 +322,201 @@ def int_to_text(num):
     """
     if num == 0:
         return '\x00'
-    bytes_list = []
-    while num > 0:
-        bytes_list.append(num & 0xFF)
-        num = num >> 8
-    bytes_list.reverse()
     try:
-        return bytes(bytes_list).decode('utf-8')
+        return num.to_bytes((num.bit_length() + 7) // 8, 'big').decode('utf-8')
     except UnicodeDecodeError as e:
         raise ValueError(f"Decoded bytes are not valid UTF-8: {e}")
 
-def file_to_int(file_path):
+def read_file_blocks(file_path):
     """
-    Convert a file's binary content to an integer.
+    Read a file in FILE_BLOCK_BYTES blocks, padding the last block.
+    
+    The last block always gets FILE_PAD_MARKER followed by null bytes, so a file
+    whose size is a multiple of the block size ends with a block of padding.
     
     Args:
         file_path (str): Path to the input file.
     
-    Returns:
-        int: The corresponding integer.
+    Yields:
+        bytes: Blocks of exactly FILE_BLOCK_BYTES bytes.
     
     Raises:
         IOError: If the file cannot be read.
     """
     try:
         with open(file_path, 'rb') as f:
-            file_bytes = f.read()
-        num = 0
-        for byte in file_bytes:
-            num = (num << 8) + byte
-        return num
-    except Exception as e:
+            while True:
+                data = f.read(FILE_READ_BYTES)
+                full = len(data) - len(data) % FILE_BLOCK_BYTES
+                for start in range(0, full, FILE_BLOCK_BYTES):
+                    yield data[start:start + FILE_BLOCK_BYTES]
+                if len(data) < FILE_READ_BYTES:
+                    break
+    except OSError as e:
         raise IOError(f"Failed to read file '{file_path}': {e}")
+    yield (data[full:] + FILE_PAD_MARKER).ljust(FILE_BLOCK_BYTES, b'\x00')
 
-def int_to_file(num, file_path):
+def encode_file_block(block):
     """
-    Convert an integer to binary data and write to a file.
+    Encode one FILE_BLOCK_BYTES block into FILE_BLOCK_CHARS NewCode characters.
     
     Args:
-        num (int): The integer to convert.
-        file_path (str): Path to the output file.
+        block (bytes): The block to encode.
+    
+    Returns:
+        str: The NewCode string for the block.
+    """
+    # Files have many blocks, so gmpy2's import cost is worth paying
+    num = int.from_bytes(block, 'big')
+    return _group_digits(_int_to_digit_str(num, FILE_BLOCK_DIGITS, use_gmpy2=True))
+
+def decode_file_block(crypttext):
+    """
+    Decode one FILE_BLOCK_CHARS NewCode block back into FILE_BLOCK_BYTES bytes.
+    
+    Args:
+        crypttext (str): The NewCode string for the block.
+    
+    Returns:
+        bytes: The decoded block.
     
     Raises:
-        IOError: If the file cannot be written.
+        ValueError: If the block is malformed or contains invalid characters.
+    """
+    digits = _ungroup_digits(crypttext)
+    if len(digits) != FILE_BLOCK_DIGITS:
+        raise ValueError(f"Invalid file block: expected {FILE_BLOCK_DIGITS} digits, got {len(digits)}")
+    return _parse_digits(digits, crypttext).to_bytes(FILE_BLOCK_BYTES, 'big')
+
+def _file_workers(nblocks, workers):
+    """
+    Pick the number of worker processes for a file of nblocks blocks.
+    
+    Args:
+        nblocks (int): Number of blocks in the file.
+        workers (int or None): Requested worker count, or None to decide from
+            the file size and os.cpu_count().
+    
+    Returns:
+        int: The number of workers; 1 means no process pool.
+    """
+    if workers is not None:
+        return max(1, workers)
+    if nblocks < FILE_PARALLEL_BLOCKS:
+        return 1
+    return os.cpu_count() or 1
+
+def _map_blocks(func, items, workers):
+    """
+    Map func over items in order, on a process pool when workers > 1.
+    
+    Items are submitted in batches of FILE_BATCH_BLOCKS, keeping one batch
+    queued ahead of the one being consumed, so memory stays bounded.
+    
+    Args:
+        func (callable): A picklable module-level function.
+        items (iterable): The items to map over.
+        workers (int): Number of worker processes.
+    
+    Yields:
+        The results of func, in the order of items.
+    """
+    if workers <= 1:
+        yield from map(func, items)
+        return
+    
+    # Only large files get here, so keep multiprocessing out of CLI startup
+    from concurrent.futures import ProcessPoolExecutor
+    
+    items = iter(items)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        while batch := list(islice(items, FILE_BATCH_BLOCKS)):
+            pending.append(executor.map(func, batch, chunksize=FILE_CHUNK_BLOCKS))
+            if len(pending) > 1:
+                yield from pending.popleft()
+        while pending:
+            yield from pending.popleft()
+
+def iter_encode_file(input_file_path, workers=None):
+    """
+    Encode a file into NewCode one block at a time.
+    
+    Joining the yielded strings with '-' gives the same result as encode_file.
+    
+    Args:
+        input_file_path (str): Path to the input file.
+        workers (int, optional): Number of worker processes. Defaults to all
+            CPUs for large files and 1 otherwise.
+    
+    Yields:
+        str: The NewCode string for each block.
+    
+    Raises:
+        IOError: If the file cannot be read.
     """
-    if num == 0:
-        bytes_list = [0]
-    else:
-        bytes_list = []
-        while num > 0:
-            bytes_list.append(num & 0xFF)
-            num = num >> 8
-        bytes_list.reverse()
     try:
-        with open(file_path, 'wb') as f:
-            f.write(bytes(bytes_list))
-    except Exception as e:
-        raise IOError(f"Failed to write to file '{file_path}': {e}")
+        nblocks = os.path.getsize(input_file_path) // FILE_BLOCK_BYTES
+    except OSError:
+        nblocks = 0  # read_file_blocks reports the error
+    blocks = read_file_blocks(input_file_path)
+    yield from _map_blocks(encode_file_block, blocks, _file_workers(nblocks, workers))
+
+def _decode_file_blocks(input_crypttext, workers):
+    """
+    Decode the blocks of a NewCode file string whose layout has been checked.
+    
+    Args:
+        input_crypttext (str): The NewCode string produced by encode_file.
+        workers (int or None): Number of worker processes, or None to decide
+            from the number of blocks.
+    
+    Yields:
+        bytes: The decoded blocks, with the padding removed from the last one.
+    
+    Raises:
+        ValueError: If a block contains invalid characters or the last block
+            has no padding marker.
+    """
+    stride = FILE_BLOCK_CHARS + 1
+    texts = (input_crypttext[start:start + FILE_BLOCK_CHARS]
+             for start in range(0, len(input_crypttext), stride))
+    nblocks = (len(input_crypttext) + 1) // stride
+    
+    previous = None
+    for block in _map_blocks(decode_file_block, texts, _file_workers(nblocks, workers)):
+        if previous is not None:
+            yield previous
+        previous = block
+    
+    data = previous.rstrip(b'\x00')
+    if not data.endswith(FILE_PAD_MARKER):
+        raise ValueError("Invalid NewCode file: missing padding marker")
+    yield data[:-len(FILE_PAD_MARKER)]
+
+def iter_decode_file(input_crypttext, workers=None):
+    """
+    Decode a NewCode file string one block at a time.
+    
+    The overall layout is checked up front, before anything is yielded.
+    
+    Args:
+        input_crypttext (str): The NewCode string produced by encode_file.
+        workers (int, optional): Number of worker processes. Defaults to all
+            CPUs for large files and 1 otherwise.
+    
+    Returns:
+        iterator of bytes: The decoded file content, with the padding removed
+            from the end.
+    
+    Raises:
+        ValueError: If the string is not a well-formed NewCode file.
+    """
+    # Block separators also fall on every fifth character, like group separators
+    if (len(input_crypttext) % (FILE_BLOCK_CHARS + 1) != FILE_BLOCK_CHARS
+            or input_crypttext[4::5] != '-' * (len(input_crypttext) // 5)):
+        raise ValueError("Invalid NewCode file: expected whole blocks of 4-character groups")
+    return _decode_file_blocks(input_crypttext, workers)
 
 def encode_number(input_num):
     """
@@ -189,6 +540,7 @@ def encode_number(input_num):
     
     return int_to_crypttext(num)
 
+@lru_cache(maxsize=4096)
 def encode_text(input_text):
     """
     Encode text into NewCode.
@@ -215,8 +567,7 @@ def encode_file(input_file_path):
     Raises:
         IOError: If the file cannot be read.
     """
-    num = file_to_int(input_file_path)
-    return int_to_crypttext(num)
+    return '-'.join(iter_encode_file(input_file_path))
 
 def decode_to_number(input_crypttext):
     """
@@ -230,6 +581,7 @@ def decode_to_number(input_crypttext):
     """
     return crypttext_to_int(input_crypttext)
 
+@lru_cache(maxsize=4096)
 def decode_to_text(input_crypttext):
     """
     Decode a NewCode string back into text.
@@ -252,10 +604,80 @@ def decode_to_file(input_crypttext, output_file_path):
         output_file_path (str): Path to the output file.
     
     Raises:
+        ValueError: If the string is not a well-formed NewCode file.
         IOError: If the file cannot be written.
     """
-    num = crypttext_to_int(input_crypttext)
-    int_to_file(num, output_file_path)
+    blocks = iter_decode_file(input_crypttext)
+    
+    # Blocks are only fully validated as they are decoded, so write to a temporary
+    # file next to the target and replace the target once everything succeeded;
+    # invalid input never truncates an existing file. Symlinks are resolved so
+    # the file they point to is replaced, not the link itself.
+    target_path = os.path.realpath(output_file_path)
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(target_path))
+    except OSError as e:
+        raise IOError(f"Failed to write to file '{output_file_path}': {e}")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for data in blocks:
+                f.write(data)
+        # mkstemp creates the file as 0600; use the permissions open() would give
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, target_path)
+    except BaseException as e:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        if isinstance(e, OSError):
+            raise IOError(f"Failed to write to file '{output_file_path}': {e}") from e
+        raise
+
+def _cli_encode_number(args):
+    print(f"Encoded NewCode: {encode_number(args.input)}")
+
+def _cli_encode_text(args):
+    print(f"Encoded NewCode: {encode_text(args.input)}")
+
+def _cli_encode_file(args):
+    if not os.path.isfile(args.input):
+        raise IOError(f"File '{args.input}' does not exist.")
+    # Stream block by block instead of building the whole string. The first
+    # block is read before printing anything, so open/read errors leave stdout
+    # untouched.
+    blocks = iter_encode_file(args.input)
+    first = next(blocks)
+    print("Encoded NewCode: ", end='')
+    sys.stdout.write(first)
+    for block in blocks:
+        sys.stdout.write('-')
+        sys.stdout.write(block)
+    print()
+
+def _cli_decode_number(args):
+    print(f"Decoded Number: {decode_to_number(args.input)}")
+
+def _cli_decode_text(args):
+    print(f"Decoded Text: {decode_to_text(args.input)}")
+
+def _cli_decode_file(args):
+    if not args.output_file:
+        raise ValueError("'--output-file' is required when decoding to file.")
+    decode_to_file(args.input, args.output_file)
+    print(f"Decoded file has been saved to '{args.output_file}'")
+
+# (command, --type/--output) -> CLI handler
+CLI_HANDLERS = {
+    ('encode', 'number'): _cli_encode_number,
+    ('encode', 'text'): _cli_encode_text,
+    ('encode', 'file'): _cli_encode_file,
+    ('decode', 'number'): _cli_decode_number,
+    ('decode', 'text'): _cli_decode_text,
+    ('decode', 'file'): _cli_decode_file,
+}
 
 def main():
     parser = argparse.ArgumentParser(
@@ -276,69 +698,16 @@ def main():
     decode_parser.add_argument('--output-file', help='Output file path (required if decoding to file)')
     
     args = parser.parse_args()
-    
-    if args.command == 'encode':
-        if args.type == 'number':
-            try:
-                result = encode_number(args.input)
-                print(f"Encoded NewCode: {result}")
-            except ValueError as e:
-                print(f"Error: {e}", file=sys.stderr)
-                sys.exit(1)
-        elif args.type == 'text':
-            try:
-                result = encode_text(args.input)
-                print(f"Encoded NewCode: {result}")
-            except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
-                sys.exit(1)
-        elif args.type == 'file':
-            if not os.path.isfile(args.input):
-                print(f"Error: File '{args.input}' does not exist.", file=sys.stderr)
-                sys.exit(1)
-            try:
-                result = encode_file(args.input)
-                print(f"Encoded NewCode: {result}")
-            except IOError as e:
-                print(f"Error: {e}", file=sys.stderr)
-                sys.exit(1)
-        else:
-            print("Invalid encode type. Use 'number', 'text', or 'file'.", file=sys.stderr)
-            sys.exit(1)
-    elif args.command == 'decode':
-        if args.output == 'number':
-            try:
-                result = decode_to_number(args.input)
-                print(f"Decoded Number: {result}")
-            except ValueError as e:
-                print(f"Error: {e}", file=sys.stderr)
-                sys.exit(1)
-        elif args.output == 'text':
-            try:
-                result = decode_to_text(args.input)
-                print(f"Decoded Text: {result}")
-            except ValueError as e:
-                print(f"Error: {e}", file=sys.stderr)
-                sys.exit(1)
-            except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
-                sys.exit(1)
-        elif args.output == 'file':
-            if not args.output_file:
-                print("Error: '--output-file' is required when decoding to file.", file=sys.stderr)
-                sys.exit(1)
-            try:
-                decode_to_file(args.input, args.output_file)
-                print(f"Decoded file has been saved to '{args.output_file}'")
-            except IOError as e:
-                print(f"Error: {e}", file=sys.stderr)
-                sys.exit(1)
-        else:
-            print("Invalid decode output type. Use 'number', 'text', or 'file'.", file=sys.stderr)
-            sys.exit(1)
-    else:
+    if args.command is None:
         parser.print_help()
         sys.exit(1)
+    
+    kind = args.type if args.command == 'encode' else args.output
+    try:
+        CLI_HANDLERS[(args.command, kind)](args)
+    except (ValueError, IOError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
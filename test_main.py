@@ -0,0 +1,156 @@
+import argparse
+import io
+import os
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import main
+
+
+class DecodeToFileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.source = os.path.join(self.tmp.name, 'source.bin')
+        self.target = os.path.join(self.tmp.name, 'target.bin')
+        with open(self.source, 'wb') as f:
+            f.write(os.urandom(200 * 1024))
+        with open(self.target, 'wb') as f:
+            f.write(b'existing content')
+
+    def assertTargetUntouched(self):
+        with open(self.target, 'rb') as f:
+            self.assertEqual(f.read(), b'existing content')
+        # No temporary file is left behind either
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['source.bin', 'target.bin'])
+
+    def test_round_trip(self):
+        main.decode_to_file(main.encode_file(self.source), self.target)
+        with open(self.source, 'rb') as a, open(self.target, 'rb') as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_invalid_character_keeps_existing_file(self):
+        encoded = main.encode_file(self.source)
+        bad = encoded[:1000] + 'I' + encoded[1001:]
+        with self.assertRaisesRegex(ValueError, 'Invalid character: I'):
+            main.decode_to_file(bad, self.target)
+        self.assertTargetUntouched()
+
+    def test_missing_padding_marker_keeps_existing_file(self):
+        zero_block = main.encode_file_block(bytes(main.FILE_BLOCK_BYTES))
+        with self.assertRaisesRegex(ValueError, 'missing padding marker'):
+            main.decode_to_file(zero_block + '-' + zero_block, self.target)
+        self.assertTargetUntouched()
+
+    def test_invalid_input_creates_no_file(self):
+        os.remove(self.target)
+        zero_block = main.encode_file_block(bytes(main.FILE_BLOCK_BYTES))
+        with self.assertRaises(ValueError):
+            main.decode_to_file(zero_block, self.target)
+        self.assertEqual(os.listdir(self.tmp.name), ['source.bin'])
+
+    def test_block_digit_count_error(self):
+        block = main.encode_file_block(bytes(main.FILE_BLOCK_BYTES))
+        bad = block[:2] + '-' + block[3:]  # 159 characters, 127 digits
+        with self.assertRaisesRegex(ValueError, 'expected 128 digits, got 127'):
+            main.decode_file_block(bad)
+
+    def test_leftover_temp_file_is_ignored(self):
+        # A run killed mid-write with the same PID must not block later runs
+        with open(f"{self.target}.{os.getpid()}.tmp", 'wb') as f:
+            f.write(b'stale')
+        main.decode_to_file(main.encode_file(self.source), self.target)
+        with open(self.source, 'rb') as a, open(self.target, 'rb') as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_writes_through_symlink(self):
+        link = os.path.join(self.tmp.name, 'link.bin')
+        os.symlink(self.target, link)
+        main.decode_to_file(main.encode_file(self.source), link)
+        self.assertTrue(os.path.islink(link))
+        with open(self.source, 'rb') as a, open(self.target, 'rb') as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_default_permissions(self):
+        os.remove(self.target)
+        main.decode_to_file(main.encode_file(self.source), self.target)
+        umask = os.umask(0)
+        os.umask(umask)
+        self.assertEqual(os.stat(self.target).st_mode & 0o777, 0o666 & ~umask)
+
+
+class SmallIntTest(unittest.TestCase):
+    def values(self):
+        rng = random.Random(0)
+        for bits in range(55, 66):
+            yield (1 << bits) - 1
+            yield 1 << (bits - 1)
+            yield rng.getrandbits(bits) | (1 << (bits - 1))
+            yield (rng.getrandbits(bits) | (1 << (bits - 1))) & ~31  # divisible by 32
+        yield from range(1, 1 << 12)
+
+    def test_matches_general_path(self):
+        for num in self.values():
+            expected = main._group_digits(main._int_to_digit_str(num))
+            self.assertEqual(main.int_to_crypttext(num), expected, num)
+            if num.bit_length() <= main.CHUNK_BITS:
+                self.assertEqual(main._small_int_to_crypttext(num), expected, num)
+
+    def test_round_trip(self):
+        for num in self.values():
+            # A trailing zero digit is indistinguishable from 'A' padding
+            if num % main.BASE:
+                self.assertEqual(main.crypttext_to_int(main.int_to_crypttext(num)), num, num)
+
+
+class ParallelFileTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.source = os.path.join(tmp.name, 'source.bin')
+        with open(self.source, 'wb') as f:
+            f.write(os.urandom(main.FILE_BLOCK_BYTES * 50 + 7))
+        # Several small batches, so ordering across batch boundaries is exercised
+        patcher = mock.patch.multiple(main, FILE_BATCH_BLOCKS=8, FILE_CHUNK_BLOCKS=3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_encode_matches_serial(self):
+        serial = list(main.iter_encode_file(self.source, workers=1))
+        self.assertEqual(list(main.iter_encode_file(self.source, workers=2)), serial)
+
+    def test_decode_matches_serial(self):
+        encoded = main.encode_file(self.source)
+        serial = b''.join(main.iter_decode_file(encoded, workers=1))
+        self.assertEqual(b''.join(main.iter_decode_file(encoded, workers=2)), serial)
+        with open(self.source, 'rb') as f:
+            self.assertEqual(serial, f.read())
+
+    def test_worker_error_propagates(self):
+        encoded = main.encode_file(self.source)
+        # Inside block 40, well past the first batches
+        pos = 40 * (main.FILE_BLOCK_CHARS + 1) + 2
+        bad = encoded[:pos] + 'I' + encoded[pos + 1:]
+        with self.assertRaisesRegex(ValueError, '^Invalid character: I$'):
+            list(main.iter_decode_file(bad, workers=2))
+
+
+class CliEncodeFileTest(unittest.TestCase):
+    def test_read_error_prints_nothing(self):
+        def failing_blocks(file_path):
+            raise IOError(f"Failed to read file '{file_path}': denied")
+            yield
+
+        with tempfile.NamedTemporaryFile() as f, \
+                mock.patch.object(main, 'read_file_blocks', failing_blocks):
+            out = io.StringIO()
+            with redirect_stdout(out), self.assertRaisesRegex(IOError, 'denied'):
+                main._cli_encode_file(argparse.Namespace(input=f.name))
+        self.assertEqual(out.getvalue(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()